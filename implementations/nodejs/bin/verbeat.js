@@ -5,6 +5,25 @@ import { getVersion, bumpVersion, getVersionComponents } from '../src/verbeat.js
 function main() {
     const args = process.argv.slice(2);
     
+    let date = null;
+    const dateIndex = args.indexOf('--date');
+    if (dateIndex !== -1) {
+        const dateStr = args[dateIndex + 1] || '';
+        const match = /^(\d{4})-(\d{2})-(\d{2})$/.exec(dateStr);
+        if (match) {
+            const [year, month, day] = match.slice(1).map(Number);
+            date = new Date(year, month - 1, day);
+            if (date.getMonth() !== month - 1 || date.getDate() !== day) {
+                date = null;
+            }
+        }
+        if (!date) {
+            console.log(`Error: Invalid date format '${dateStr}'. Use YYYY-MM-DD format.`);
+            process.exit(1);
+        }
+        args.splice(dateIndex, 2);
+    }
+    
     if (args.length === 0) {
         console.log('Usage: verbeat <command> [options]');
         console.log('');
@@ -13,10 +32,14 @@ function main() {
         console.log('  bump [comment]             - Bump manual version');
         console.log('  components                 - Get version components');
         console.log('');
+        console.log('Options:');
+        console.log('  --date YYYY-MM-DD          - Date to use for version calculation');
+        console.log('');
         console.log('Examples:');
         console.log('  verbeat version');
         console.log('  verbeat bump "New feature"');
         console.log('  verbeat components');
+        console.log('  verbeat version --date 2025-07-15');
         process.exit(1);
     }
     
@@ -25,7 +48,7 @@ function main() {
     try {
         switch (command) {
             case 'version':
-                const version = getVersion();
+                const version = getVersion(null, date);
                 console.log(version);
                 break;
                 
@@ -36,7 +59,7 @@ function main() {
                 break;
                 
             case 'components':
-                const [manual, yymm, commits] = getVersionComponents();
+                const [manual, yymm, commits] = getVersionComponents(null, date);
                 console.log(`Manual: ${manual}`);
                 console.log(`Date: ${yymm}`);
                 console.log(`Commits: ${commits}`);
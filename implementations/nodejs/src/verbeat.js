@@ -86,7 +86,7 @@ class VerBeat {
     }
 
     getCurrentVersion(date = null) {
-        const manualVersion = this._getManualVersion();
+        const manualVersion = this._getManualVersionAt(date);
         const dateObj = date || new Date();
         const commitCount = this._getCommitCountForMonth(dateObj);
         
@@ -97,7 +97,7 @@ class VerBeat {
     }
 
     getVersionComponents(date = null) {
-        const manualVersion = this._getManualVersion();
+        const manualVersion = this._getManualVersionAt(date);
         const dateObj = date || new Date();
         const commitCount = this._getCommitCountForMonth(dateObj);
         
@@ -185,6 +185,94 @@ class VerBeat {
         return Math.max(...history.map(([version]) => version));
     }
 
+    _getManualVersionAt(date) {
+        const manualVersion = this._getManualVersion();
+        if (!date) {
+            return manualVersion;
+        }
+
+        // A date covers the whole day, so bumps made on it count.
+        const cutoff = new Date(date.getFullYear(), date.getMonth(), date.getDate() + 1);
+        if (cutoff > new Date()) {
+            return manualVersion;
+        }
+
+        const events = this._getBumpTimeline();
+        if (events.length === 0) {
+            return manualVersion;
+        }
+
+        // Dates before the first bump use the file as first committed.
+        const cutoffSeconds = Math.max(cutoff.getTime() / 1000, events[0][0]);
+        const present = new Map();
+        for (const [timestamp, delta, version] of events) {
+            if (timestamp > cutoffSeconds) {
+                break;
+            }
+            const count = (present.get(version) || 0) + delta;
+            if (count > 0) {
+                present.set(version, count);
+            } else {
+                present.delete(version);
+            }
+        }
+
+        return present.size > 0 ? Math.max(...present.keys()) : manualVersion;
+    }
+
+    _getBumpTimeline() {
+        // Every version line added to or removed from the version file, from
+        // a single first-parent `git log -p` pass, with merges diffed against
+        // their first parent. Sorted by commit timestamp.
+        if (!fs.existsSync(path.join(this.projectRoot, '.git'))) {
+            return [];
+        }
+
+        let output;
+        try {
+            output = execSync(
+                'git log --format=%x01%H%x20%ct --reverse --first-parent ' +
+                '--diff-merges=first-parent --patch --unified=0 ' +
+                '--no-color --no-ext-diff --no-renames HEAD -- verbeat.version',
+                {
+                    cwd: this.projectRoot,
+                    encoding: 'utf8',
+                    stdio: ['ignore', 'pipe', 'ignore'],
+                    maxBuffer: 64 * 1024 * 1024
+                }
+            );
+        } catch (error) {
+            return [];
+        }
+
+        const events = [];
+        let commit = null;
+        let timestamp = null;
+        for (const line of output.split('\n')) {
+            if (line.startsWith('\x01')) {
+                [commit, timestamp] = line.slice(1).split(' ');
+                timestamp = parseInt(timestamp, 10);
+                continue;
+            }
+            if (commit === null || line.startsWith('+++') || line.startsWith('---')) {
+                continue;
+            }
+            if (!line.startsWith('+') && !line.startsWith('-')) {
+                continue;
+            }
+
+            const versionStr = line.slice(1).split('#')[0].trim();
+            if (!/^[+-]?\d+$/.test(versionStr)) {
+                continue;
+            }
+            const delta = line[0] === '+' ? 1 : -1;
+            events.push([timestamp, delta, parseInt(versionStr, 10), commit]);
+        }
+
+        // Array.prototype.sort is stable, so each commit's lines keep their order.
+        return events.sort((a, b) => a[0] - b[0]);
+    }
+
     _getCommitCountForMonth(date) {
         try {
             const gitDir = path.join(this.projectRoot, '.git');
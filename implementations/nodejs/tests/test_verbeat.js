@@ -163,6 +163,76 @@ function testGitIntegration() {
     }
 }
 
+function testHistoricalManualVersion() {
+    console.log('Testing historical manual version...');
+    
+    const tempDir = createTempDir();
+    
+    try {
+        const versionFile = path.join(tempDir, 'verbeat.version');
+        execSync('git init', { cwd: tempDir });
+        execSync('git config user.name "Test User"', { cwd: tempDir });
+        execSync('git config user.email "test@example.com"', { cwd: tempDir });
+        
+        const commitAt = (stamp, message) => {
+            execSync(`git add verbeat.version && git commit -m "${message}"`, {
+                cwd: tempDir,
+                env: { ...process.env, GIT_AUTHOR_DATE: stamp, GIT_COMMITTER_DATE: stamp }
+            });
+        };
+        
+        fs.writeFileSync(versionFile, '1 # Initial release\n');
+        commitAt('2025-01-10T12:00:00', 'Initial release');
+        fs.appendFileSync(versionFile, '2 # Breaking API changes\n');
+        commitAt('2025-03-05T12:00:00', 'Bump to 2');
+        
+        // A mistyped bump that is later corrected only counts while it was
+        // in the file.
+        fs.appendFileSync(versionFile, '20 # Typo\n');
+        commitAt('2025-07-01T12:00:00', 'Bump to 20');
+        fs.writeFileSync(versionFile, '1 # Initial release\n2 # Breaking API changes\n3 # Fixed\n');
+        commitAt('2025-08-01T12:00:00', 'Fix typo');
+
+        // A version resolved while merging a conflicting bump counts from
+        // the merge.
+        const fixed = '1 # Initial release\n2 # Breaking API changes\n3 # Fixed\n';
+        execSync('git checkout -q -b feature', { cwd: tempDir });
+        fs.writeFileSync(versionFile, `${fixed}4 # Feature\n`);
+        commitAt('2025-09-01T12:00:00', 'Bump to 4 on feature');
+        execSync('git checkout -q -', { cwd: tempDir });
+        fs.writeFileSync(versionFile, `${fixed}4 # Mainline\n`);
+        commitAt('2025-09-02T12:00:00', 'Bump to 4 on mainline');
+        try {
+            execSync('git merge -q feature', { cwd: tempDir, stdio: 'ignore' });
+        } catch (error) {
+            // Conflicting bumps are resolved by hand below.
+        }
+        fs.writeFileSync(versionFile, `${fixed}4 # Mainline\n5 # Feature\n`);
+        commitAt('2025-10-01T12:00:00', 'Merge feature');
+
+        const verbeat = new VerBeat(tempDir);
+        const cases = [
+            [new Date(2025, 1, 15), '1.2502.0'],
+            [new Date(2025, 2, 5), '2.2503.1'],
+            [new Date(2025, 5, 1), '2.2506.0'],
+            [new Date(2025, 6, 15), '20.2507.1'],
+            [new Date(2025, 7, 15), '3.2508.1'],
+            [new Date(2025, 9, 15), '5.2510.1'],
+        ];
+        for (const [date, expected] of cases) {
+            const version = verbeat.getCurrentVersion(date);
+            console.log(`  Version for ${date.toDateString()}: ${version}`);
+            if (version !== expected) {
+                throw new Error(`expected ${expected}, got ${version}`);
+            }
+        }
+        
+        console.log('  ✓ Historical manual version test passed');
+    } finally {
+        cleanupTempDir(tempDir);
+    }
+}
+
 function testCLI() {
     console.log('Testing CLI interface...');
     
@@ -218,6 +288,9 @@ function main() {
         testGitIntegration();
         console.log();
         
+        testHistoricalManualVersion();
+        console.log();
+        
         testCLI();
         console.log();
         
@@ -1,11 +1,17 @@
 #!/usr/bin/env python3
 
 import os
+import sys
+import time
 import tempfile
+import threading
 import subprocess
 from pathlib import Path
 
-from verbeat import get_version, get_version_components
+from datetime import datetime
+
+import verbeat
+from verbeat import VerBeat, get_version, get_version_components, profile_version
 
 
 def test_outside_git_repo():
@@ -178,6 +184,376 @@ def test_git_command_failure():
             raise
 
 
+def test_concurrent_lookups_coalesce():
+    print("Testing concurrent lookups coalesce...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        subprocess.run(["git", "init", "-q"], cwd=temp_path, check=True)
+        subprocess.run(
+            ["git", "config", "user.name", "Test User"], cwd=temp_path, check=True
+        )
+        subprocess.run(
+            ["git", "config", "user.email", "test@example.com"],
+            cwd=temp_path,
+            check=True,
+        )
+
+        version_file = temp_path / "verbeat.version"
+        with open(version_file, "w") as f:
+            f.write("1 # Initial release\n")
+
+        subprocess.run(["git", "add", "verbeat.version"], cwd=temp_path, check=True)
+        subprocess.run(
+            ["git", "commit", "-q", "-m", "Initial commit"], cwd=temp_path, check=True
+        )
+
+        calls = []
+        original = VerBeat._count_commits_for_month
+
+        def counting(self, date):
+            calls.append(date)
+            return original(self, date)
+
+        VerBeat._count_commits_for_month = counting
+        try:
+            barrier = threading.Barrier(8)
+            versions = []
+
+            def worker():
+                barrier.wait()
+                versions.append(get_version(temp_path))
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            print(f"  Versions: {set(versions)}, computations: {len(calls)}")
+
+            assert len(versions) == 8, f"Expected 8 results, got {len(versions)}"
+            assert len(set(versions)) == 1, f"Results disagree: {set(versions)}"
+            assert len(calls) == 1, f"Expected 1 computation, got {len(calls)}"
+
+            if verbeat.fcntl is not None:
+                head = subprocess.run(
+                    ["git", "rev-parse", "HEAD"],
+                    cwd=temp_path,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                ).stdout.strip()
+                result_file = temp_path / ".git" / "verbeat.result"
+                assert result_file.exists(), "Expected a published result under .git/"
+
+                # Later lookups read the published result instead of recomputing.
+                assert get_version(temp_path) == versions[0]
+                assert len(calls) == 1, f"Expected no recomputation, got {len(calls)}"
+
+                # A process holding the lock makes others wait for its result.
+                result_file.unlink()
+                holder = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import fcntl, os, sys, time; "
+                        "fd = os.open(sys.argv[1], os.O_CREAT | os.O_RDWR); "
+                        "fcntl.flock(fd, fcntl.LOCK_EX); "
+                        "print('locked', flush=True); time.sleep(0.3); "
+                        "open(sys.argv[2], 'w').write(sys.argv[3]); "
+                        "time.sleep(0.1)",
+                        str(temp_path / ".git" / "verbeat.lock"),
+                        str(result_file),
+                        f"{head} {datetime.now():%Y-%m} 42\n",
+                    ],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                holder.stdout.readline()
+                version = get_version(temp_path)
+                holder.wait()
+                assert version.endswith(".42"), f"Expected waited-for result: {version}"
+                assert len(calls) == 1, f"Expected no recomputation, got {len(calls)}"
+
+                # A holder that dies releases the lock with it.
+                result_file.unlink()
+                holder = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import fcntl, os, sys; "
+                        "fd = os.open(sys.argv[1], os.O_CREAT | os.O_RDWR); "
+                        "fcntl.flock(fd, fcntl.LOCK_EX); os._exit(1)",
+                        str(temp_path / ".git" / "verbeat.lock"),
+                    ]
+                )
+                holder.wait()
+                start = time.monotonic()
+                assert get_version(temp_path) == versions[0]
+                assert time.monotonic() - start < 5, "Waited on a dead holder's lock"
+
+            # Threads writing the same file never share a temp file.
+            target = temp_path / ".git" / "verbeat.result"
+            errors = []
+            barrier = threading.Barrier(8)
+
+            def writer(n):
+                barrier.wait()
+                try:
+                    for _ in range(50):
+                        verbeat._atomic_write(target, f"writer {n}\n" * 100)
+                except OSError as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=writer, args=(n,)) for n in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert not errors, f"Concurrent writes failed: {errors}"
+            lines = set(target.read_text(encoding="utf-8").splitlines())
+            assert len(lines) == 1, f"Interleaved writes: {lines}"
+            target.unlink()
+
+            print("  ✓ Concurrent lookups coalesce test passed")
+
+        except Exception as e:
+            print(f"  ✗ Concurrent lookups coalesce test failed: {e}")
+            raise
+        finally:
+            VerBeat._count_commits_for_month = original
+
+
+def test_historical_manual_version():
+    print("Testing historical manual version...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        subprocess.run(["git", "init", "-q"], cwd=temp_path, check=True)
+        subprocess.run(
+            ["git", "config", "user.name", "Test User"], cwd=temp_path, check=True
+        )
+        subprocess.run(
+            ["git", "config", "user.email", "test@example.com"],
+            cwd=temp_path,
+            check=True,
+        )
+
+        version_file = temp_path / "verbeat.version"
+
+        def commit_at(stamp, message):
+            env = {**os.environ, "GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp}
+            subprocess.run(["git", "add", "verbeat.version"], cwd=temp_path, check=True)
+            subprocess.run(
+                ["git", "commit", "-q", "-m", message],
+                cwd=temp_path,
+                env=env,
+                check=True,
+            )
+
+        version_file.write_text("1 # Initial release\n")
+        commit_at("2025-01-10T12:00:00", "Initial release")
+        version_file.write_text("1 # Initial release\n2 # Breaking API changes\n")
+        commit_at("2025-03-05T12:00:00", "Bump to 2")
+
+        try:
+            cases = [
+                (datetime(2024, 12, 1), "1.2412.0"),
+                (datetime(2025, 2, 15), "1.2502.0"),
+                (datetime(2025, 3, 5), "2.2503.1"),
+                (datetime(2025, 6, 1), "2.2506.0"),
+            ]
+            for date, expected in cases:
+                version = get_version(temp_path, date)
+                print(f"  Version for {date.date()}: {version}")
+                assert version == expected, f"Expected {expected}, got {version}"
+
+            timeline_file = temp_path / ".git" / "verbeat.timeline"
+            assert timeline_file.exists(), "Expected a cached timeline under .git/"
+
+            # New bumps extend the cached timeline as HEAD moves.
+            version_file.write_text("1\n2\n3 # Third\n")
+            commit_at("2025-05-05T12:00:00", "Bump to 3")
+            version = get_version(temp_path, datetime(2025, 6, 1))
+            assert version == "3.2506.0", f"Expected 3.2506.0, got {version}"
+            assert version == get_version(temp_path, datetime(2025, 6, 1))
+
+            manual, _, _ = get_version_components(temp_path)
+            assert manual == 3, f"Expected current manual version 3, got {manual}"
+
+            # A mistyped bump that is later corrected only counts while it
+            # was in the file.
+            version_file.write_text("1\n2\n3 # Third\n20 # Typo\n")
+            commit_at("2025-07-01T12:00:00", "Bump to 20")
+            version_file.write_text("1\n2\n3 # Third\n4 # Fourth\n")
+            commit_at("2025-08-01T12:00:00", "Fix typo")
+            cases = [
+                (datetime(2025, 6, 1), "3.2506.0"),
+                (datetime(2025, 7, 15), "20.2507.1"),
+                (datetime(2025, 8, 15), "4.2508.1"),
+            ]
+            for date, expected in cases:
+                version = get_version(temp_path, date)
+                print(f"  Version for {date.date()}: {version}")
+                assert version == expected, f"Expected {expected}, got {version}"
+
+            # A conflict resolved in a merge counts from the merge, and a
+            # timeline cached on the merged-in branch is rebuilt, not extended.
+            base = "1\n2\n3 # Third\n4 # Fourth\n"
+            subprocess.run(
+                ["git", "checkout", "-q", "-b", "feature"], cwd=temp_path, check=True
+            )
+            version_file.write_text(f"{base}9 # Feature\n")
+            commit_at("2025-09-01T12:00:00", "Bump to 9 on feature")
+            version = get_version(temp_path, datetime(2025, 9, 15))
+            assert version == "9.2509.1", f"Expected 9.2509.1, got {version}"
+
+            subprocess.run(["git", "checkout", "-q", "-"], cwd=temp_path, check=True)
+            version_file.write_text(f"{base}5 # Mainline\n")
+            commit_at("2025-09-02T12:00:00", "Bump to 5 on mainline")
+            subprocess.run(
+                ["git", "merge", "-q", "feature"], cwd=temp_path, capture_output=True
+            )
+            version_file.write_text(f"{base}5 # Mainline\n6 # Feature\n")
+            commit_at("2025-10-01T12:00:00", "Merge feature")
+            cases = [
+                (datetime(2025, 9, 15), "5.2509.2"),
+                (datetime(2025, 10, 15), "6.2510.1"),
+            ]
+            for date, expected in cases:
+                version = get_version(temp_path, date)
+                print(f"  Version for {date.date()}: {version}")
+                assert version == expected, f"Expected {expected}, got {version}"
+
+            print("  ✓ Historical manual version test passed")
+
+        except Exception as e:
+            print(f"  ✗ Historical manual version test failed: {e}")
+            raise
+
+
+def test_profile():
+    print("Testing profile...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        subprocess.run(["git", "init", "-q"], cwd=temp_path, check=True)
+        subprocess.run(
+            ["git", "config", "user.name", "Test User"], cwd=temp_path, check=True
+        )
+        subprocess.run(
+            ["git", "config", "user.email", "test@example.com"],
+            cwd=temp_path,
+            check=True,
+        )
+
+        version_file = temp_path / "verbeat.version"
+        with open(version_file, "w") as f:
+            f.write("1 # Initial release\n")
+
+        subprocess.run(["git", "add", "verbeat.version"], cwd=temp_path, check=True)
+        subprocess.run(
+            ["git", "commit", "-q", "-m", "Initial commit"], cwd=temp_path, check=True
+        )
+
+        # One pack from gc plus one loose blob written afterwards.
+        subprocess.run(
+            ["git", "-c", "gc.writeCommitGraph=false", "gc", "-q"],
+            cwd=temp_path,
+            check=True,
+        )
+        subprocess.run(
+            ["git", "hash-object", "-w", "--stdin"],
+            cwd=temp_path,
+            input="loose object\n",
+            text=True,
+            capture_output=True,
+            check=True,
+        )
+
+        try:
+            report = profile_version(temp_path)
+            labels = [label for label, _ in report["stages"]]
+            print(f"  Stages: {labels}")
+
+            assert report["version"] == get_version(temp_path)
+            assert "_get_manual_version (parse verbeat.version)" in labels
+            assert any(label.startswith("git rev-list") for label in labels)
+            repository = report["repository"]
+            assert repository["git"] is True
+            assert repository["commits"] == 1, repository
+            assert repository["packs"] == 1, repository
+            assert repository["loose_objects"] == 1, repository
+            assert repository["commit_graph"] is False, repository
+
+            # Published results and cached timelines do not hide the git work.
+            date = datetime(2025, 6, 1)
+            get_version(temp_path, date)
+            report = profile_version(temp_path, date)
+            labels = [label for label, _ in report["stages"]]
+            assert any(label.startswith("git rev-list") for label in labels), labels
+            assert any(label.startswith("git log") for label in labels), labels
+            assert not any(label.startswith("published result") for label in labels)
+            assert report["cached"] is False
+
+            # With cached=True the lookup is served from the published result.
+            report = profile_version(temp_path, date, cached=True)
+            labels = [label for label, _ in report["stages"]]
+            assert not any(label.startswith("git ") for label in labels), labels
+            assert any("without --cached" in r for r in report["recommendations"])
+
+            if verbeat.fcntl is not None:
+                # A lookup stuck behind another process's lock shows the wait.
+                (temp_path / ".git" / "verbeat.result").unlink()
+                holder = subprocess.Popen(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import fcntl, os, sys, time; "
+                        "fd = os.open(sys.argv[1], os.O_CREAT | os.O_RDWR); "
+                        "fcntl.flock(fd, fcntl.LOCK_EX); "
+                        "print('locked', flush=True); time.sleep(0.4)",
+                        str(temp_path / ".git" / "verbeat.lock"),
+                    ],
+                    stdout=subprocess.PIPE,
+                    text=True,
+                )
+                holder.stdout.readline()
+                report = profile_version(temp_path, cached=True)
+                holder.wait()
+                waits = dict(report["stages"])
+                lock_wait = waits.get("lock wait (.git/verbeat.lock)", 0.0)
+                print(f"  Lock wait: {lock_wait * 1000:.1f} ms")
+                assert lock_wait > 0.2, f"Expected the lock wait to be timed: {waits}"
+                assert report["recommendations"][0].startswith("lock:")
+
+            # A slow walk without a commit-graph points at the index.
+            slow_walk = {
+                "lookup_seconds": 1.0,
+                "repeat_seconds": 1.0,
+                "stages": [
+                    ("git --version", 0.002),
+                    ("git rev-list --count --since=2025-01-01 HEAD", 0.9),
+                ],
+                "repository": {**repository, "commits": 100000},
+            }
+            recommendations = verbeat._recommend(slow_walk)
+            assert any(r.startswith("index:") for r in recommendations)
+            slow_walk["repository"] = {**slow_walk["repository"], "commit_graph": True}
+            recommendations = verbeat._recommend(slow_walk)
+            assert not any(r.startswith("index:") for r in recommendations)
+
+            print("  ✓ Profile test passed")
+
+        except Exception as e:
+            print(f"  ✗ Profile test failed: {e}")
+            raise
+
+
 def main():
     print("Running VerBeat Git edge case tests...\n")
 
@@ -197,6 +573,15 @@ def main():
         test_git_command_failure()
         print()
 
+        test_concurrent_lookups_coalesce()
+        print()
+
+        test_historical_manual_version()
+        print()
+
+        test_profile()
+        print()
+
         print("🎉 All Git edge case tests passed!")
 
     except Exception as e:
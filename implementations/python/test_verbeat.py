@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
+import os
+import stat
 import tempfile
 from pathlib import Path
 from datetime import datetime
 
-from verbeat import VerBeat, get_version, bump_version, get_version_components
+from verbeat import (
+    VerBeat,
+    VerBeatError,
+    get_version,
+    bump_version,
+    get_version_components,
+    stamp_version,
+)
 
 
 def test_basic_functionality():
@@ -117,6 +126,90 @@ def test_error_handling():
         print("  ✓ Error handling test passed")
 
 
+def test_stamp():
+    print("Testing stamp...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+
+        version_file = temp_path / "verbeat.version"
+        with open(version_file, "w") as f:
+            f.write("1 # Initial release\n")
+
+        readme = temp_path / "README.md"
+        readme.write_text(
+            "# Project\n\n![Version](https://img.shields.io/badge/version-0.0.0-blue)\n"
+        )
+        (temp_path / "pkg").mkdir()
+        version_py = temp_path / "pkg" / "_version.py"
+        version_py.write_text('"""Version."""\n__version__ = "0.0.0"\n')
+
+        version, written = stamp_version(
+            temp_path,
+            json_files=["version.json"],
+            badge_files=["README.md"],
+            python_files=["pkg/_version.py"],
+        )
+        print(f"  Stamped {version} into {[p.name for p in written]}")
+
+        assert len(written) == 3, f"Expected 3 files written, got {written}"
+        assert (temp_path / "version.json").read_text() == (
+            f'{{"version": "{version}"}}\n'
+        )
+        assert f"badge/version-{version}-blue)" in readme.read_text()
+        assert version_py.read_text() == (
+            f'"""Version."""\n__version__ = "{version}"\n'
+        )
+
+        _, written = stamp_version(
+            temp_path,
+            json_files=["version.json"],
+            badge_files=["README.md"],
+            python_files=["pkg/_version.py"],
+        )
+        assert written == [], f"Expected current targets to be skipped: {written}"
+        assert not list(temp_path.glob(".*.tmp")), "Temporary files left behind"
+
+        # Other keys, non-ASCII text and file modes survive a rewrite.
+        package = temp_path / "package.json"
+        package.write_text('{\n  "author": "Jörg",\n  "version": "0"\n}\n')
+        os.chmod(package, 0o640)
+        version_py.write_text("x = 1")
+        stamp_version(temp_path, json_files=["package.json"])
+        assert package.read_text() == (
+            f'{{\n  "author": "Jörg",\n  "version": "{version}"\n}}\n'
+        ), package.read_text()
+        assert stat.S_IMODE(package.stat().st_mode) == 0o640
+        stamp_version(temp_path, python_files=["pkg/_version.py"])
+        assert version_py.read_text() == f'x = 1\n__version__ = "{version}"\n'
+
+        # Annotated assignments are replaced, not duplicated.
+        version_py.write_text('__version__: str = "0.0.0"\n')
+        stamp_version(temp_path, python_files=["pkg/_version.py"])
+        assert version_py.read_text() == f'__version__ = "{version}"\n'
+
+        # A date stamps the version for that date.
+        dated, _ = stamp_version(
+            temp_path, json_files=["version.json"], date=datetime(2024, 3, 15)
+        )
+        assert dated == "1.2403.0", dated
+        assert (temp_path / "version.json").read_text() == (
+            '{"version": "1.2403.0"}\n'
+        )
+
+        # Malformed JSON is reported and left untouched.
+        for malformed in ('{"name": "app", "version": "0",}\n', "[1, 2]\n"):
+            package.write_text(malformed)
+            try:
+                stamp_version(temp_path, json_files=["package.json"])
+                raise AssertionError("Expected an error for malformed JSON")
+            except VerBeatError as e:
+                assert "not a JSON object" in str(e), str(e)
+            assert package.read_text() == malformed, "Malformed JSON was rewritten"
+
+        print("  ✓ Stamp test passed")
+
+
 def main():
     print("Running VerBeat Python implementation tests...\n")
 
@@ -133,6 +226,9 @@ def main():
         test_error_handling()
         print()
 
+        test_stamp()
+        print()
+
         print("🎉 All tests passed!")
 
     except Exception as e:
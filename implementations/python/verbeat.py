@@ -12,11 +12,25 @@ Where:
 - C: Commit count for the current month (activity tempo)
 """
 
+import os
+import re
 import sys
+import json
+import stat
+import time
 import argparse
-from datetime import datetime
+import threading
+import subprocess
+from bisect import bisect_right
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Dict, Optional, Tuple, List
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process coordination
+    fcntl = None
 
 
 def _get_verbeat_version() -> str:
@@ -85,13 +99,534 @@ class VerBeatGitError(VerBeatError):
     pass
 
 
+class _Recorder:
+    """Wall-clock stages for `verbeat profile`, excluding nested stages."""
+
+    def __init__(self):
+        self.stages: List[Tuple[str, float]] = []
+
+    @contextmanager
+    def stage(self, label: str):
+        first_stage = len(self.stages)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = sum(seconds for _, seconds in self.stages[first_stage:])
+            self.stages.append((label, max(elapsed - nested, 0.0)))
+
+
+def _stage(recorder: Optional[_Recorder], label: str):
+    return recorder.stage(label) if recorder is not None else nullcontext()
+
+
+def _run_git(
+    args: List[str],
+    cwd: Optional[Path] = None,
+    recorder: Optional[_Recorder] = None,
+    text: bool = True,
+) -> subprocess.CompletedProcess:
+    label = "".join(c for c in " ".join(["git", *args]) if c.isprintable())
+    with _stage(recorder, label):
+        return subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=text, check=True
+        )
+
+
+# Concurrent lookups for the same (root, HEAD, month) share one computation:
+# threads in this process wait on the leader's flight, and processes on the
+# same host coordinate through an flock on a lock file under .git/ and read
+# the result the winner publishes next to it. The OS drops the flock when its
+# holder exits, so a crashed process never leaves a stale lock behind.
+_LOCK_FILE_NAME = "verbeat.lock"
+_RESULT_FILE_NAME = "verbeat.result"
+_LOCK_POLL_INTERVAL = 0.02
+_LOCK_WAIT_TIMEOUT = 10.0
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Optional[int] = None
+        self.error: Optional[BaseException] = None
+
+
+_flights: Dict[Tuple[str, str, str], _Flight] = {}
+_flights_lock = threading.Lock()
+
+
+def _read_head(git_dir: Path) -> Optional[str]:
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    if not head.startswith("ref: "):
+        return head or None
+
+    ref = head[len("ref: ") :]
+    try:
+        return (git_dir / ref).read_text().strip() or None
+    except OSError:
+        pass
+
+    try:
+        with open(git_dir / "packed-refs", "r") as f:
+            for line in f:
+                parts = line.strip().split(" ", 1)
+                if len(parts) == 2 and parts[1] == ref:
+                    return parts[0]
+    except OSError:
+        pass
+
+    return None
+
+
+def _read_published_result(
+    result_path: Path, key: Tuple[str, str, str]
+) -> Optional[int]:
+    try:
+        fields = result_path.read_text().split()
+    except OSError:
+        return None
+
+    if len(fields) != 3 or tuple(fields[:2]) != key[1:]:
+        return None
+
+    try:
+        return int(fields[2])
+    except ValueError:
+        return None
+
+
+def _atomic_write(path: Path, text: str):
+    tmp_path = path.with_name(
+        f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+    )
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        if path.exists():
+            os.chmod(tmp_path, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _publish_result(result_path: Path, key: Tuple[str, str, str], value: int):
+    try:
+        _atomic_write(result_path, f"{key[1]} {key[2]} {value}\n")
+    except OSError:
+        pass
+
+
+def _acquire_lock(fd: int, deadline: float) -> bool:
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except BlockingIOError:
+            if time.monotonic() > deadline:
+                return False
+            time.sleep(_LOCK_POLL_INTERVAL)
+        except OSError:
+            return False
+
+
+def _compute_across_processes(
+    git_dir: Path,
+    key: Tuple[str, str, str],
+    compute: Callable[[], int],
+    recorder: Optional[_Recorder] = None,
+) -> int:
+    result_path = git_dir / _RESULT_FILE_NAME
+    result_label = f"published result read (.git/{_RESULT_FILE_NAME})"
+
+    with _stage(recorder, result_label):
+        published = _read_published_result(result_path, key)
+    if published is not None:
+        return published
+
+    if fcntl is None:
+        return compute()
+
+    try:
+        fd = os.open(git_dir / _LOCK_FILE_NAME, os.O_CREAT | os.O_RDWR, 0o644)
+    except OSError:
+        return compute()
+
+    try:
+        # A holder that outlives the timeout is still alive and walking; stop
+        # waiting and compute alongside it rather than stealing its lock.
+        with _stage(recorder, f"lock wait (.git/{_LOCK_FILE_NAME})"):
+            acquired = _acquire_lock(fd, time.monotonic() + _LOCK_WAIT_TIMEOUT)
+        if not acquired:
+            return compute()
+
+        with _stage(recorder, result_label):
+            published = _read_published_result(result_path, key)
+        if published is not None:
+            return published
+
+        value = compute()
+        _publish_result(result_path, key, value)
+        return value
+    finally:
+        os.close(fd)
+
+
+def _single_flight(
+    git_dir: Path,
+    key: Tuple[str, str, str],
+    compute: Callable[[], int],
+    recorder: Optional[_Recorder] = None,
+) -> int:
+    with _flights_lock:
+        flight = _flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = _flights[key] = _Flight()
+
+    if not leader:
+        with _stage(recorder, "in-process flight wait"):
+            flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = _compute_across_processes(git_dir, key, compute, recorder)
+        return flight.result
+    except BaseException as e:
+        flight.error = e
+        raise
+    finally:
+        with _flights_lock:
+            del _flights[key]
+        flight.done.set()
+
+
+# Historical queries need the manual version as it was at a date, not today's
+# maximum. The bump timeline records every version line added to or removed
+# from verbeat.version, so the highest version present in the file can be
+# read at any timestamp. It is built from one `git log -p` pass over the
+# file, cached under .git/ keyed by HEAD and extended incrementally as HEAD
+# moves. Timelines are never changed in place: extending one builds a new
+# object, so threads reading a shared timeline always see a complete index.
+_TIMELINE_FILE_NAME = "verbeat.timeline"
+_COMMIT_MARKER = "\x01"
+
+
+class _BumpTimeline:
+    def __init__(self, head: str, events: List[Tuple[int, int, int, str]]):
+        self.head = head
+        self.events = tuple(events)
+
+        present: Dict[int, int] = {}
+        timestamps: List[int] = []
+        highest: List[Optional[int]] = []
+        for timestamp, delta, version, _ in sorted(self.events, key=lambda e: e[0]):
+            count = present.get(version, 0) + delta
+            if count > 0:
+                present[version] = count
+            else:
+                present.pop(version, None)
+            timestamps.append(timestamp)
+            highest.append(max(present) if present else None)
+
+        self._timestamps = timestamps
+        self._highest = highest
+
+    def extended(
+        self, head: str, events: List[Tuple[int, int, int, str]]
+    ) -> "_BumpTimeline":
+        return _BumpTimeline(head, list(self.events) + events)
+
+    def manual_version_at(self, timestamp: float) -> Optional[int]:
+        if not self._timestamps:
+            return None
+        # Dates before the first bump use the file as first committed.
+        index = bisect_right(self._timestamps, max(timestamp, self._timestamps[0]))
+        return self._highest[index - 1]
+
+    def dumps(self) -> str:
+        lines = [f"head {self.head}"]
+        lines.extend(f"{t} {d:+d} {v} {commit}" for t, d, v, commit in self.events)
+        return "\n".join(lines) + "\n"
+
+    @classmethod
+    def loads(cls, text: str) -> Optional["_BumpTimeline"]:
+        lines = text.splitlines()
+        if not lines or not lines[0].startswith("head "):
+            return None
+        try:
+            events = []
+            for line in lines[1:]:
+                timestamp, delta, version, commit = line.split()
+                events.append((int(timestamp), int(delta), int(version), commit))
+        except ValueError:
+            return None
+        return cls(lines[0][len("head ") :], events)
+
+
+_timelines: Dict[str, _BumpTimeline] = {}
+
+
+def _parse_bump_log(output: str) -> List[Tuple[int, int, int, str]]:
+    events = []
+    commit, timestamp = None, None
+    for line in output.splitlines():
+        if line.startswith(_COMMIT_MARKER):
+            commit, _, when = line[len(_COMMIT_MARKER) :].partition(" ")
+            timestamp = int(when)
+            continue
+        if commit is None or line.startswith(("+++", "---")):
+            continue
+        if not line.startswith(("+", "-")):
+            continue
+
+        delta = 1 if line[0] == "+" else -1
+        version_str = line[1:].split("#", 1)[0].strip()
+        try:
+            events.append((timestamp, delta, int(version_str), commit))
+        except ValueError:
+            continue
+    return events
+
+
+_BADGE_PATTERN = re.compile(r"https://img\.shields\.io/badge/version-[^)]*")
+_PYTHON_VERSION_PATTERN = re.compile(
+    r"^__version__\s*(?::[^=]*)?=.*$", re.MULTILINE
+)
+
+
+def _stamp_json(current: Optional[str], version: str) -> Optional[str]:
+    data = {}
+    if current is not None:
+        try:
+            data = json.loads(current)
+        except ValueError:
+            data = None
+        if not isinstance(data, dict):
+            raise ValueError("not a JSON object")
+        if data.get("version") == version:
+            return current
+    data["version"] = version
+    indent = None
+    if current is not None:
+        nested = re.search(r"^\{\s*\n([ \t]+)\S", current)
+        indent = nested.group(1) if nested else None
+    return json.dumps(data, indent=indent, ensure_ascii=False) + "\n"
+
+
+def _stamp_badge(current: Optional[str], version: str) -> Optional[str]:
+    if current is None:
+        return None
+    badge = f"https://img.shields.io/badge/version-{version}-blue"
+    return _BADGE_PATTERN.sub(lambda _: badge, current)
+
+
+def _stamp_python(current: Optional[str], version: str) -> Optional[str]:
+    line = f'__version__ = "{version}"'
+    if current is None or not _PYTHON_VERSION_PATTERN.search(current):
+        if current is None:
+            return f"{line}\n"
+        separator = "" if not current or current.endswith("\n") else "\n"
+        return f"{current}{separator}{line}\n"
+    return _PYTHON_VERSION_PATTERN.sub(lambda _: line, current, count=1)
+
+
+# `verbeat profile` times each stage of a real lookup, including every git
+# subprocess (run through _run_git), lock waits and published-result reads,
+# and relates the costs to how the repository is laid out.
+_PROFILE_TOP_FUNCTIONS = 8
+_PROFILE_LABEL_WIDTH = 60
+
+
+def _describe_repository(project_root: Path) -> Dict[str, object]:
+    git_dir = project_root / ".git"
+    info: Dict[str, object] = {
+        "git": git_dir.is_dir(),
+        "commits": 0,
+        "packs": 0,
+        "loose_objects": 0,
+        "commit_graph": False,
+        "version_file_lines": 0,
+    }
+
+    try:
+        with open(project_root / "verbeat.version", "r") as f:
+            info["version_file_lines"] = sum(1 for _ in f)
+    except OSError:
+        pass
+
+    if not info["git"]:
+        return info
+
+    objects = git_dir / "objects"
+    info["commit_graph"] = (objects / "info" / "commit-graph").exists() or (
+        objects / "info" / "commit-graphs"
+    ).is_dir()
+
+    try:
+        result = _run_git(["count-objects", "-v"], project_root)
+        counts = dict(
+            line.split(": ", 1) for line in result.stdout.splitlines() if ": " in line
+        )
+        info["loose_objects"] = int(counts.get("count", 0))
+        info["packs"] = int(counts.get("packs", 0))
+
+        result = _run_git(["rev-list", "--count", "HEAD"], project_root)
+        info["commits"] = int(result.stdout.strip())
+    except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+        pass
+
+    return info
+
+
+def _stage_totals(stages: List[Tuple[str, float]]) -> Dict[str, float]:
+    totals: Dict[str, float] = {}
+    for label, seconds in stages:
+        totals[label] = totals.get(label, 0.0) + seconds
+    return totals
+
+
+def _recommend(report: Dict[str, object]) -> List[str]:
+    repo = report["repository"]
+    stages = _stage_totals(report["stages"])
+    total = report["lookup_seconds"] or 1e-9
+    repeat = report["repeat_seconds"]
+    git_calls = [(label, t) for label, t in stages.items() if label.startswith("git ")]
+    git_time = sum(t for _, t in git_calls)
+    spawn = min((t for _, t in git_calls), default=0.0)
+    walk = max((t for _, t in git_calls), default=0.0)
+    recommendations = []
+
+    lock_wait = stages.get(f"lock wait (.git/{_LOCK_FILE_NAME})", 0.0)
+    if lock_wait > 0.01 and lock_wait / total > 0.5:
+        recommendations.append(
+            f"lock: waited {lock_wait * 1000:.1f} ms on .git/{_LOCK_FILE_NAME} "
+            "while another verbeat process computed the same lookup; that "
+            "process's git walk is the real cost, profile it once the lock is free"
+        )
+
+    if git_calls and spawn * len(git_calls) > git_time / 2:
+        recommendations.append(
+            f"native reader: {len(git_calls)} git processes cost at least "
+            f"{spawn * 1000:.1f} ms each just to start; most git time is process "
+            "startup, so reading .git directly would remove it"
+        )
+
+    full_walk = stages.get("git rev-list --count HEAD", 0.0)
+    if full_walk > spawn * 2 and full_walk / total > 0.5:
+        recommendations.append(
+            "native reader: `git rev-list --count HEAD` walks all "
+            f"{repo['commits']} commits only to detect an empty repository; "
+            "resolving HEAD from .git is enough"
+        )
+
+    if repo["git"] and not repo["commit_graph"] and walk > spawn * 2:
+        recommendations.append(
+            "index: no commit-graph found; run "
+            "`git commit-graph write --reachable` so rev-list walks read it "
+            f"instead of parsing {repo['commits']} commits"
+        )
+
+    if repo["packs"] > 20 or repo["loose_objects"] > 5000:
+        recommendations.append(
+            f"repack: {repo['packs']} packs and {repo['loose_objects']} loose "
+            "objects; run `git gc` or `git maintenance run` to repack"
+        )
+
+    result_read = f"published result read (.git/{_RESULT_FILE_NAME})"
+    if repo["git"] and not git_calls and result_read in stages:
+        recommendations.append(
+            f"cache: this lookup was served from .git/{_RESULT_FILE_NAME}; "
+            "profile without --cached to time the git walk"
+        )
+    elif repo["git"] and repeat * 2 < total:
+        recommendations.append(
+            "cache: repeated lookups at this HEAD and month are already served "
+            f"from .git/{_RESULT_FILE_NAME} "
+            f"({repeat * 1000:.1f} ms vs {total * 1000:.1f} ms)"
+        )
+    elif repo["git"] and git_time / total > 0.5:
+        recommendations.append(
+            "cache: repeated lookups are not faster; check that "
+            f".git/{_RESULT_FILE_NAME} can be written so processes can share "
+            "the published result"
+        )
+
+    parse_time = stages.get("_get_manual_version (parse verbeat.version)", 0.0)
+    if parse_time > 0.001 and parse_time / total > 0.5:
+        recommendations.append(
+            f"cache: parsing verbeat.version ({repo['version_file_lines']} lines) "
+            "dominates; keep the version file short"
+        )
+
+    if not recommendations:
+        recommendations.append("no dominant cost; lookups are already fast")
+    return recommendations
+
+
+def _format_profile_report(report: Dict[str, object]) -> str:
+    stages = sorted(
+        _stage_totals(report["stages"]).items(),
+        key=lambda stage: stage[1],
+        reverse=True,
+    )
+    total = report["lookup_seconds"] or 1e-9
+    repo = report["repository"]
+
+    lines = [
+        f"VerBeat profile for {report['project_root']}",
+        f"Version: {report['version']}",
+        f"Lookup{' (cached)' if report['cached'] else ''}: {total * 1000:.2f} ms, "
+        f"repeat lookup: {report['repeat_seconds'] * 1000:.2f} ms",
+        "",
+        "Time breakdown (ranked):",
+    ]
+    for label, seconds in stages:
+        if len(label) > _PROFILE_LABEL_WIDTH:
+            label = label[: _PROFILE_LABEL_WIDTH - 3] + "..."
+        lines.append(
+            f"  {seconds * 1000:9.2f} ms {seconds / total * 100:5.1f}%  {label}"
+        )
+
+    lines += [
+        "",
+        "Repository:",
+        f"  Git repository: {'yes' if repo['git'] else 'no'}",
+        f"  Commits:        {repo['commits']}",
+        f"  Packs:          {repo['packs']}",
+        f"  Loose objects:  {repo['loose_objects']}",
+        f"  Commit-graph:   {'yes' if repo['commit_graph'] else 'no'}",
+        f"  Version lines:  {repo['version_file_lines']}",
+        "",
+        "Top VerBeat functions (cProfile, cumulative):",
+    ]
+    for name, calls, seconds in report["functions"]:
+        lines.append(f"  {seconds * 1000:9.2f} ms {calls:6d} calls  {name}")
+
+    lines += ["", "Recommendations:"]
+    lines += [f"  - {recommendation}" for recommendation in report["recommendations"]]
+    return "\n".join(lines)
+
+
 class VerBeat:
     def __init__(self, project_root: Optional[str] = None):
         self.project_root = Path(project_root) if project_root else Path.cwd()
         self.version_file = self.project_root / "verbeat.version"
+        self._recorder: Optional[_Recorder] = None
+        self._read_caches = True
 
     def get_current_version(self, date: Optional[datetime] = None) -> str:
-        manual_version = self._get_manual_version()
+        manual_version = self._get_manual_version_at(date)
         date_obj = date or datetime.now()
         commit_count = self._get_commit_count_for_month(date_obj)
 
@@ -103,7 +638,7 @@ class VerBeat:
     def get_version_components(
         self, date: Optional[datetime] = None
     ) -> Tuple[int, str, int]:
-        manual_version = self._get_manual_version()
+        manual_version = self._get_manual_version_at(date)
         date_obj = date or datetime.now()
         commit_count = self._get_commit_count_for_month(date_obj)
 
@@ -161,6 +696,104 @@ class VerBeat:
 
         return sorted(history, key=lambda x: x[0])
 
+    def stamp(
+        self,
+        json_files: Optional[List[str]] = None,
+        badge_files: Optional[List[str]] = None,
+        python_files: Optional[List[str]] = None,
+        stage: bool = False,
+        date: Optional[datetime] = None,
+    ) -> Tuple[str, List[Path]]:
+        if json_files is None and badge_files is None and python_files is None:
+            json_files, badge_files = ["version.json"], ["README.md"]
+
+        version = self.get_current_version(date)
+        targets = (
+            [(name, _stamp_json) for name in json_files or []]
+            + [(name, _stamp_badge) for name in badge_files or []]
+            + [(name, _stamp_python) for name in python_files or []]
+        )
+
+        written = []
+        for name, render in targets:
+            path = self.project_root / name
+            try:
+                current = path.read_text(encoding="utf-8") if path.exists() else None
+                updated = render(current, version)
+                if updated is None or updated == current:
+                    continue
+                _atomic_write(path, updated)
+            except (OSError, ValueError) as e:
+                raise VerBeatError(f"Cannot stamp {path}: {e}")
+            written.append(path)
+
+        if stage:
+            existing = [str(self.project_root / name) for name, _ in targets]
+            existing = [name for name in existing if Path(name).exists()]
+            if existing:
+                try:
+                    _run_git(["add", "--", *existing], self.project_root)
+                except (subprocess.CalledProcessError, FileNotFoundError) as e:
+                    raise VerBeatGitError(f"Cannot stage stamped files: {e}")
+
+        return version, written
+
+    def profile(
+        self, date: Optional[datetime] = None, cached: bool = False
+    ) -> Dict[str, object]:
+        import cProfile
+        import pstats
+
+        recorder = _Recorder()
+        profiler = cProfile.Profile()
+
+        # The profiled lookup ignores the published result and the timeline
+        # cache unless asked not to, so it times the work a cold lookup does.
+        # It still refreshes both, so the repeat lookup shows the cached path.
+        self._recorder = recorder
+        self._read_caches = cached
+        try:
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                version = self.get_current_version(date)
+            finally:
+                profiler.disable()
+            lookup_seconds = time.perf_counter() - start
+        finally:
+            self._recorder = None
+            self._read_caches = True
+
+        start = time.perf_counter()
+        self.get_current_version(date)
+        repeat_seconds = time.perf_counter() - start
+
+        functions = []
+        stats = pstats.Stats(profiler).stats
+        own = [
+            (name, line, calls, cumulative)
+            for (filename, line, name), (_, calls, _, cumulative, _) in stats.items()
+            if Path(filename).resolve() == Path(__file__).resolve()
+            and not name.startswith("<")
+        ]
+        for name, line, calls, cumulative in sorted(
+            own, key=lambda entry: entry[3], reverse=True
+        )[:_PROFILE_TOP_FUNCTIONS]:
+            functions.append((f"{name} (verbeat.py:{line})", calls, cumulative))
+
+        report: Dict[str, object] = {
+            "project_root": str(self.project_root),
+            "version": version,
+            "cached": cached,
+            "lookup_seconds": lookup_seconds,
+            "repeat_seconds": repeat_seconds,
+            "stages": recorder.stages,
+            "functions": functions,
+            "repository": _describe_repository(self.project_root),
+        }
+        report["recommendations"] = _recommend(report)
+        return report
+
     def _get_manual_version(self) -> int:
         if not self.version_file.exists():
             raise VerBeatVersionFileError(
@@ -177,26 +810,137 @@ class VerBeat:
 
         return max(version for version, _ in history)
 
+    def _get_manual_version_at(self, date: Optional[datetime]) -> int:
+        with _stage(self._recorder, "_get_manual_version (parse verbeat.version)"):
+            manual_version = self._get_manual_version()
+        if date is None:
+            return manual_version
+
+        # A date covers the whole day, so bumps made on it count.
+        cutoff = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        cutoff += timedelta(days=1)
+        if cutoff > datetime.now(date.tzinfo):
+            return manual_version
+
+        with _stage(self._recorder, "bump timeline lookup"):
+            timeline = self._get_bump_timeline()
+            if timeline is None:
+                return manual_version
+
+            historical = timeline.manual_version_at(cutoff.timestamp())
+        return manual_version if historical is None else historical
+
+    def _get_bump_timeline(self) -> Optional[_BumpTimeline]:
+        git_dir = self.project_root / ".git"
+        head = _read_head(git_dir) if git_dir.is_dir() else None
+        if head is None:
+            return None
+
+        cache_key = str(git_dir.resolve())
+        timeline = _timelines.get(cache_key) if self._read_caches else None
+        if timeline is None and self._read_caches:
+            try:
+                timeline = _BumpTimeline.loads(
+                    (git_dir / _TIMELINE_FILE_NAME).read_text()
+                )
+            except OSError:
+                timeline = None
+
+        if timeline is not None and timeline.head == head:
+            _timelines[cache_key] = timeline
+            return timeline
+
+        if timeline is not None:
+            # Only extend when the old head is on HEAD's first-parent chain;
+            # otherwise the new range would not line up with the stored events.
+            try:
+                result = _run_git(
+                    [
+                        "rev-list",
+                        "--first-parent",
+                        "--parents",
+                        "--reverse",
+                        f"{timeline.head}..{head}",
+                    ],
+                    self.project_root,
+                    self._recorder,
+                )
+                oldest = result.stdout.split("\n", 1)[0].split()
+                if len(oldest) < 2 or oldest[1] != timeline.head:
+                    timeline = None
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                timeline = None
+
+        revisions = f"{timeline.head}..{head}" if timeline is not None else head
+        try:
+            result = _run_git(
+                [
+                    "log",
+                    f"--format={_COMMIT_MARKER}%H %ct",
+                    "--reverse",
+                    "--first-parent",
+                    "--diff-merges=first-parent",
+                    "--patch",
+                    "--unified=0",
+                    "--no-color",
+                    "--no-ext-diff",
+                    "--no-renames",
+                    revisions,
+                    "--",
+                    self.version_file.name,
+                ],
+                self.project_root,
+                self._recorder,
+            )
+            events = _parse_bump_log(result.stdout)
+        except (subprocess.CalledProcessError, FileNotFoundError, ValueError):
+            return None
+
+        if timeline is None:
+            timeline = _BumpTimeline(head, events)
+        else:
+            timeline = timeline.extended(head, events)
+
+        _timelines[cache_key] = timeline
+        try:
+            _atomic_write(git_dir / _TIMELINE_FILE_NAME, timeline.dumps())
+        except OSError:
+            pass
+        return timeline
+
     def _get_commit_count_for_month(self, date: datetime) -> int:
+        with _stage(self._recorder, "commit count for month"):
+            git_dir = self.project_root / ".git"
+            head = _read_head(git_dir) if git_dir.is_dir() else None
+            if head is None:
+                return self._count_commits_for_month(date)
+
+            key = (str(self.project_root.resolve()), head, date.strftime("%Y-%m"))
+            if not self._read_caches:
+                value = self._count_commits_for_month(date)
+                _publish_result(git_dir / _RESULT_FILE_NAME, key, value)
+                return value
+            return _single_flight(
+                git_dir,
+                key,
+                lambda: self._count_commits_for_month(date),
+                self._recorder,
+            )
+
+    def _count_commits_for_month(self, date: datetime) -> int:
         try:
             git_dir = self.project_root / ".git"
             if not git_dir.exists():
                 return 0
 
-            import subprocess
-
             try:
-                subprocess.run(["git", "--version"], capture_output=True, check=True)
+                _run_git(["--version"], recorder=self._recorder)
             except (subprocess.CalledProcessError, FileNotFoundError):
                 return 0
 
             try:
-                result = subprocess.run(
-                    ["git", "rev-list", "--count", "HEAD"],
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
-                    check=True,
+                result = _run_git(
+                    ["rev-list", "--count", "HEAD"], self.project_root, self._recorder
                 )
                 total_commits = int(result.stdout.strip())
                 if total_commits == 0:
@@ -213,19 +957,16 @@ class VerBeat:
             start_str = start_date.strftime("%Y-%m-%d")
             end_str = end_date.strftime("%Y-%m-%d")
 
-            result = subprocess.run(
+            result = _run_git(
                 [
-                    "git",
                     "rev-list",
                     "--count",
                     f"--since={start_str}",
                     f"--until={end_str}",
                     "HEAD",
                 ],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                check=True,
+                self.project_root,
+                self._recorder,
             )
 
             return int(result.stdout.strip())
@@ -234,8 +975,6 @@ class VerBeat:
             return 0
         except ValueError:
             return 0
-        except ImportError:
-            return 0
 
 
 def get_version(
@@ -257,6 +996,27 @@ def get_version_components(
     return verbeat.get_version_components(date)
 
 
+def stamp_version(
+    project_root: Optional[str] = None,
+    json_files: Optional[List[str]] = None,
+    badge_files: Optional[List[str]] = None,
+    python_files: Optional[List[str]] = None,
+    stage: bool = False,
+    date: Optional[datetime] = None,
+) -> Tuple[str, List[Path]]:
+    verbeat = VerBeat(project_root)
+    return verbeat.stamp(json_files, badge_files, python_files, stage, date)
+
+
+def profile_version(
+    project_root: Optional[str] = None,
+    date: Optional[datetime] = None,
+    cached: bool = False,
+) -> Dict[str, object]:
+    verbeat = VerBeat(project_root)
+    return verbeat.profile(date, cached)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="VerBeat - A 3D Versioning System for Real-World Dev Flow",
@@ -266,12 +1026,17 @@ Examples:
   verbeat version                    # Show current version
   verbeat bump "New feature"        # Bump manual version
   verbeat components                # Show version components
+  verbeat stamp --stage             # Update version.json and README badge
+  verbeat stamp --python pkg/_version.py
+  verbeat profile --project /path   # Diagnose slow version lookups
   verbeat version --project /path   # Use specific project path
         """,
     )
 
     parser.add_argument(
-        "command", choices=["version", "bump", "components"], help="Command to execute"
+        "command",
+        choices=["version", "bump", "components", "stamp", "profile"],
+        help="Command to execute",
     )
 
     parser.add_argument(
@@ -289,6 +1054,36 @@ Examples:
         "--date", help="Date to use for version calculation (YYYY-MM-DD format)"
     )
 
+    parser.add_argument(
+        "--json",
+        action="append",
+        help="JSON file to stamp with the version (stamp command, repeatable)",
+    )
+
+    parser.add_argument(
+        "--badge",
+        action="append",
+        help="Markdown file whose version badge to stamp (stamp command, repeatable)",
+    )
+
+    parser.add_argument(
+        "--python",
+        action="append",
+        help="Python file whose __version__ to stamp (stamp command, repeatable)",
+    )
+
+    parser.add_argument(
+        "--stage",
+        action="store_true",
+        help="git add the stamped files (stamp command)",
+    )
+
+    parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="profile a lookup served by the shared caches (profile command)",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -316,6 +1111,19 @@ Examples:
             new_version = bump_version(args.comment, args.project)
             print(new_version)
 
+        elif args.command == "stamp":
+            version, written = stamp_version(
+                args.project, args.json, args.badge, args.python, args.stage, date_obj
+            )
+            for path in written:
+                print(f"Updated {path.name} with: {version}")
+            if not written:
+                print(f"All targets already at: {version}")
+
+        elif args.command == "profile":
+            report = profile_version(args.project, date_obj, args.cached)
+            print(_format_profile_report(report))
+
     except VerBeatError as e:
         print(f"Error: {e}")
         sys.exit(1)
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Cross-implementation conformance and performance harness.
+
+Generates shared Git repositories and version files, runs the Python and
+Node.js implementations against them (both the CLIs and the libraries),
+asserts that their outputs are identical and reports per-operation latency
+and throughput side by side. The Python caches under .git/ are cleared
+before every timed call, so both sides are measured cold.
+
+Usage:
+  python scripts/compare_implementations.py
+  python scripts/compare_implementations.py --commits 20000 --iterations 10
+"""
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+ROOT = Path(__file__).resolve().parent.parent
+PYTHON_DIR = ROOT / "implementations" / "python"
+NODE_DIR = ROOT / "implementations" / "nodejs"
+PYTHON_CLI = PYTHON_DIR / "verbeat.py"
+NODE_CLI = NODE_DIR / "bin" / "verbeat.js"
+NODE_LIB = NODE_DIR / "src" / "verbeat.js"
+
+sys.path.insert(0, str(PYTHON_DIR))
+
+import verbeat  # noqa: E402
+
+VERSION_FILES = {
+    "single": "1 # Initial release\n",
+    "multiple": "1 # Initial release\n2 # Breaking API changes\n3 # New engine\n",
+    "unordered": "# Project history\n\n3 # Third\n1 # First\n\n2   #   Second  \n",
+}
+
+GIT_ENV = {
+    "GIT_AUTHOR_NAME": "Test User",
+    "GIT_AUTHOR_EMAIL": "test@example.com",
+    "GIT_COMMITTER_NAME": "Test User",
+    "GIT_COMMITTER_EMAIL": "test@example.com",
+}
+
+# Runs inside Node: executes the requested library operations against one
+# project and prints their outputs and per-iteration timings as JSON.
+NODE_RUNNER = """
+import { pathToFileURL } from 'url';
+const [libPath, projectRoot, opsJson, iterations] = process.argv.slice(1);
+const lib = await import(pathToFileURL(libPath).href);
+const results = {};
+for (const [name, op, dateStr] of JSON.parse(opsJson)) {
+    let date = null;
+    if (dateStr) {
+        const [y, m, d] = dateStr.split('-').map(Number);
+        date = new Date(y, m - 1, d);
+    }
+    const call = () => {
+        const verbeat = new lib.VerBeat(projectRoot);
+        if (op === 'version') return verbeat.getCurrentVersion(date);
+        if (op === 'components') return verbeat.getVersionComponents(date);
+        return verbeat.getVersionHistory();
+    };
+    const times = [];
+    let output;
+    for (let i = 0; i < Number(iterations); i++) {
+        const start = process.hrtime.bigint();
+        try {
+            output = call();
+        } catch (error) {
+            output = `error: ${error.name}`;
+        }
+        times.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+    results[name] = { output, times };
+}
+console.log(JSON.stringify(results));
+"""
+
+
+def _git(cwd, *args, env=None, stdin=None):
+    subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        env={**os.environ, **GIT_ENV, **(env or {})},
+        input=stdin,
+        capture_output=True,
+        check=True,
+    )
+
+
+def _commit(cwd, message, when):
+    stamp = when.strftime("%Y-%m-%dT%H:%M:%S")
+    env = {"GIT_AUTHOR_DATE": stamp, "GIT_COMMITTER_DATE": stamp}
+    _git(cwd, "commit", "-q", "--allow-empty", "-m", message, env=env)
+
+
+def _fast_import_history(cwd, commits):
+    """Write a linear history of ``commits`` commits spread over 24 months."""
+    now = datetime.now()
+    end = int(now.timestamp())
+    span = 730 * 24 * 3600
+    lines = []
+    for i in range(commits):
+        ts = end - span + (span * i) // max(commits, 1)
+        lines.append("commit refs/heads/master")
+        lines.append(f"mark :{i + 1}")
+        lines.append(f"committer Test User <test@example.com> {ts} +0000")
+        message = f"commit {i}"
+        lines.append(f"data {len(message)}")
+        lines.append(message)
+        if i:
+            lines.append(f"from :{i}")
+        lines.append("")
+    _git(cwd, "fast-import", "--quiet", stdin="\n".join(lines).encode())
+    _git(cwd, "symbolic-ref", "HEAD", "refs/heads/master")
+    _git(cwd, "reset", "-q", "--hard", "master")
+
+
+def _path_without_git(base):
+    """A PATH holding only node and this Python interpreter, not git."""
+    bin_dir = base / "no-git-bin"
+    bin_dir.mkdir()
+    (bin_dir / "node").symlink_to(shutil.which("node"))
+    (bin_dir / Path(sys.executable).name).symlink_to(sys.executable)
+    return str(bin_dir)
+
+
+def build_scenarios(base, commits):
+    """Create the shared projects. Returns a list of (name, path, dates, env).
+
+    ``env`` overrides environment variables for both implementations.
+    """
+    now = datetime.now()
+    this_month = now.strftime("%Y-%m-%d")
+    scenarios = []
+
+    def project(name, version_file):
+        path = base / name
+        path.mkdir()
+        (path / "verbeat.version").write_text(VERSION_FILES[version_file])
+        return path
+
+    path = project("outside-git", "single")
+    scenarios.append(("outside-git", path, [this_month], None))
+
+    path = project("empty-git", "multiple")
+    _git(path, "init", "-q")
+    scenarios.append(("empty-git", path, [this_month], None))
+
+    path = project("broken-git", "single")
+    (path / ".git").mkdir()
+    scenarios.append(("broken-git", path, [this_month], None))
+
+    # A real repository, looked up on a machine without git.
+    path = project("git-not-installed", "multiple")
+    _git(path, "init", "-q")
+    _git(path, "add", "verbeat.version")
+    _commit(path, "initial", now)
+    env = {"PATH": _path_without_git(base)}
+    scenarios.append(("git-not-installed", path, [this_month, "2025-01-15"], env))
+
+    path = project("missing-version-file", "single")
+    (path / "verbeat.version").unlink()
+    scenarios.append(("missing-version-file", path, [this_month], None))
+
+    path = project("month-boundary", "unordered")
+    _git(path, "init", "-q")
+    boundary_commits = [
+        datetime(2024, 12, 31, 23, 30),
+        datetime(2025, 1, 1, 0, 30),
+        datetime(2025, 1, 15, 12, 0),
+        datetime(2025, 1, 31, 23, 30),
+        datetime(2025, 2, 1, 0, 30),
+        datetime(2025, 2, 28, 12, 0),
+    ]
+    for i, when in enumerate(boundary_commits):
+        _commit(path, f"boundary {i}", when)
+    dates = ["2024-12-15", "2025-01-01", "2025-01-31", "2025-02-01", "2025-02-28"]
+    scenarios.append(("month-boundary", path, dates + [this_month], None))
+
+    path = project("bump-history", "single")
+    _git(path, "init", "-q")
+    bumps = [
+        (datetime(2025, 1, 10, 12, 0), "1 # Initial release\n"),
+        (datetime(2025, 3, 5, 12, 0), "2 # Breaking API changes\n"),
+        (datetime(2025, 3, 20, 12, 0), "# Late note\n"),
+        (datetime(2025, 6, 1, 9, 0), "3 # New engine\n"),
+    ]
+    (path / "verbeat.version").write_text("")
+    for i, (when, line) in enumerate(bumps):
+        with open(path / "verbeat.version", "a") as f:
+            f.write(line)
+        _git(path, "add", "verbeat.version")
+        _commit(path, f"bump {i}", when)
+    # A mistyped bump, corrected a month later.
+    committed = (path / "verbeat.version").read_text()
+    for when, text in (
+        (datetime(2025, 7, 1, 12, 0), committed + "40 # Typo\n"),
+        (datetime(2025, 8, 1, 12, 0), committed + "4 # Fixed\n"),
+    ):
+        (path / "verbeat.version").write_text(text)
+        _git(path, "add", "verbeat.version")
+        _commit(path, "typo", when)
+    # Conflicting bumps on two branches, resolved to a new version in the merge.
+    committed = (path / "verbeat.version").read_text()
+    _git(path, "checkout", "-q", "-b", "feature")
+    (path / "verbeat.version").write_text(committed + "5 # Feature\n")
+    _git(path, "add", "verbeat.version")
+    _commit(path, "feature bump", datetime(2025, 9, 1, 12, 0))
+    _git(path, "checkout", "-q", "-")
+    (path / "verbeat.version").write_text(committed + "5 # Mainline\n")
+    _git(path, "add", "verbeat.version")
+    _commit(path, "mainline bump", datetime(2025, 9, 2, 12, 0))
+    _git(path, "merge", "-q", "-s", "ours", "--no-commit", "feature")
+    (path / "verbeat.version").write_text(committed + "5 # Mainline\n6 # Feature\n")
+    _git(path, "add", "verbeat.version")
+    _commit(path, "merge feature", datetime(2025, 10, 1, 12, 0))
+    dates = [
+        "2024-12-31",
+        "2025-01-10",
+        "2025-03-04",
+        "2025-03-05",
+        "2025-06-01",
+        "2025-07-15",
+        "2025-08-15",
+        "2025-09-15",
+        "2025-10-15",
+    ]
+    scenarios.append(("bump-history", path, dates + [this_month], None))
+
+    path = project("large-history", "multiple")
+    _git(path, "init", "-q")
+    _fast_import_history(path, commits)
+    last_month = (now.replace(day=1) - timedelta(days=1)).strftime("%Y-%m-%d")
+    scenarios.append(("large-history", path, [this_month, last_month], None))
+
+    return scenarios
+
+
+def _operations(dates):
+    ops = [("history", "history", None)]
+    for date in dates:
+        ops.append((f"version@{date}", "version", date))
+        ops.append((f"components@{date}", "components", date))
+    return ops
+
+
+def _normalize(output):
+    return json.loads(json.dumps(output))
+
+
+def _reset_python_caches(project):
+    """Drop the Python implementation's persistent and in-process caches.
+
+    Node.js always runs git, so every timed Python call starts cold too.
+    """
+    for name in (verbeat._RESULT_FILE_NAME, verbeat._TIMELINE_FILE_NAME):
+        try:
+            (project / ".git" / name).unlink()
+        except OSError:
+            pass
+    verbeat._timelines.clear()
+
+
+@contextmanager
+def _environment(env):
+    saved = {name: os.environ.get(name) for name in env or {}}
+    os.environ.update(env or {})
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def run_python_library(project, ops, iterations, env=None):
+    with _environment(env):
+        return _run_python_library(project, ops, iterations)
+
+
+def _run_python_library(project, ops, iterations):
+    results = {}
+    for name, op, date_str in ops:
+        date = datetime.strptime(date_str, "%Y-%m-%d") if date_str else None
+        times = []
+        output = None
+        for _ in range(iterations):
+            _reset_python_caches(project)
+            start = perf_counter()
+            try:
+                instance = verbeat.VerBeat(str(project))
+                if op == "version":
+                    output = instance.get_current_version(date)
+                elif op == "components":
+                    output = instance.get_version_components(date)
+                else:
+                    output = instance.get_version_history()
+            except verbeat.VerBeatError as e:
+                output = f"error: {type(e).__name__}"
+            times.append((perf_counter() - start) * 1000)
+        results[name] = {"output": _normalize(output), "times": times}
+    return results
+
+
+def run_node_library(project, ops, iterations, env=None):
+    result = subprocess.run(
+        [
+            "node",
+            "--input-type=module",
+            "-e",
+            NODE_RUNNER,
+            str(NODE_LIB),
+            str(project),
+            json.dumps(ops),
+            str(iterations),
+        ],
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _cli_commands(dates):
+    commands = [("cli version", ["version"]), ("cli components", ["components"])]
+    for date in dates:
+        commands.append((f"cli version@{date}", ["version", "--date", date]))
+        commands.append((f"cli components@{date}", ["components", "--date", date]))
+    return commands
+
+
+def _run_cli(command, cwd, iterations, before=None, env=None):
+    times = []
+    output = None
+    for _ in range(iterations):
+        if before is not None:
+            before()
+        start = perf_counter()
+        result = subprocess.run(
+            command,
+            cwd=cwd,
+            env={**os.environ, **(env or {})},
+            capture_output=True,
+            text=True,
+        )
+        times.append((perf_counter() - start) * 1000)
+        output = result.stdout.strip() if result.returncode == 0 else "error"
+    return {"output": output, "times": times}
+
+
+def run_python_cli(project, dates, iterations, env=None):
+    return {
+        name: _run_cli(
+            [sys.executable, str(PYTHON_CLI), *args, "--project", str(project)],
+            project,
+            iterations,
+            before=lambda: _reset_python_caches(project),
+            env=env,
+        )
+        for name, args in _cli_commands(dates)
+    }
+
+
+def run_node_cli(project, dates, iterations, env=None):
+    return {
+        name: _run_cli(["node", str(NODE_CLI), *args], project, iterations, env=env)
+        for name, args in _cli_commands(dates)
+    }
+
+
+def _format_rate(times):
+    med = median(times)
+    rate = 1000 / med if med else float("inf")
+    return f"{med:9.2f} ms {rate:9.1f}/s"
+
+
+def compare(scenarios, iterations):
+    mismatches = []
+    header = (
+        f"{'scenario':<22} {'operation':<28} "
+        f"{'python':>22} {'node':>22} {'ratio':>7}  match"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for scenario, project, dates, env in scenarios:
+        ops = _operations(dates)
+        python_results = run_python_library(project, ops, iterations, env)
+        python_results.update(run_python_cli(project, dates, iterations, env))
+        node_results = run_node_library(project, ops, iterations, env)
+        node_results.update(run_node_cli(project, dates, iterations, env))
+
+        for name in python_results:
+            py = python_results[name]
+            js = node_results[name]
+            match = py["output"] == js["output"]
+            if not match:
+                mismatches.append((scenario, name, py["output"], js["output"]))
+            py_med = median(py["times"])
+            js_med = median(js["times"])
+            ratio = js_med / py_med if py_med else float("inf")
+            print(
+                f"{scenario:<22} {name:<28} "
+                f"{_format_rate(py['times']):>22} {_format_rate(js['times']):>22} "
+                f"{ratio:6.2f}x  {'ok' if match else 'MISMATCH'}"
+            )
+
+    return mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the Python and Node.js VerBeat implementations"
+    )
+    parser.add_argument(
+        "--commits",
+        type=int,
+        default=5000,
+        help="Number of commits in the large-history repository",
+    )
+    parser.add_argument(
+        "--iterations", type=int, default=5, help="Timed runs per operation"
+    )
+    parser.add_argument(
+        "--keep", action="store_true", help="Keep the generated repositories"
+    )
+    args = parser.parse_args()
+
+    if shutil.which("node") is None:
+        print("Error: node not found on PATH")
+        sys.exit(1)
+
+    base = Path(tempfile.mkdtemp(prefix="verbeat-compare-"))
+    try:
+        scenarios = build_scenarios(base, args.commits)
+        mismatches = compare(scenarios, args.iterations)
+    finally:
+        if args.keep:
+            print(f"\nRepositories kept in {base}")
+        else:
+            shutil.rmtree(base, ignore_errors=True)
+
+    print()
+    if mismatches:
+        print(f"❌ {len(mismatches)} output mismatch(es):")
+        for scenario, name, py, js in mismatches:
+            print(f"  {scenario} / {name}: python={py!r} node={js!r}")
+        sys.exit(1)
+
+    print("🎉 Python and Node.js implementations agree!")
+
+
+if __name__ == "__main__":
+    main()
@@ -29,7 +29,7 @@ fi
 echo "VerBeat Git hooks installed successfully!"
 echo ""
 echo "The pre-commit hook will automatically:"
-echo "- Update version.json with current VerBeat version"
-echo "- Add version.json to your commits"
+echo "- Stamp version.json and the README badge with the current VerBeat version"
+echo "- Add them to your commits"
 echo ""
 echo "To uninstall, run: rm .git/hooks/pre-commit" 
\ No newline at end of file